@@ -11,13 +11,18 @@ setup(name='tap-eloqua',
       py_modules=['tap_eloqua'],
       install_requires=[
           'backoff==1.3.2',
-          'requests==2.20.1',
+          'ijson==3.1.4',
+          'orjson==3.5.2',
+          'requests==2.25.1',
           'pendulum==2.0.3',
           'singer-python==5.2.0'
       ],
       extras_require={
           'dev': [
               'ipdb==0.11'
+          ],
+          'cache': [
+              'requests-cache==0.9.8'
           ]
       },
       entry_points='''
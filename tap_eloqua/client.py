@@ -1,11 +1,18 @@
 import json
+import threading
 from datetime import datetime, timedelta
 
 import backoff
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
 from singer import metrics
 
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
 class Server5xxError(Exception):
     pass
 
@@ -16,7 +23,8 @@ class EloquaClient(object):
                  client_secret,
                  refresh_token,
                  redirect_uri,
-                 user_agent):
+                 user_agent,
+                 request_cache_expiry=None):
         self.__config_path = config_path
         self.__client_id = client_id
         self.__client_secret = client_secret
@@ -25,7 +33,39 @@ class EloquaClient(object):
         self.__user_agent = user_agent
         self.__access_token = None
         self.__expires = None
-        self.__session = requests.Session()
+        # The refresh token rotates on every reauth, so concurrent refresh
+        # attempts from pool workers would burn the single-use token and
+        # race the config file rewrite; only one thread may refresh
+        self.__token_lock = threading.Lock()
+        if request_cache_expiry and requests_cache:
+            # Opt-in (requires the 'cache' extra): serve repeated idempotent
+            # GETs - field/schema discovery, custom object and asset lists -
+            # from a short-lived sqlite cache, which makes development loops
+            # and quick restarts cheap. Sync polls and export data must
+            # never be served stale, so everything under /syncs/ is
+            # excluded, as is the login host.
+            self.__session = requests_cache.CachedSession(
+                cache_name='tap_eloqua_cache',
+                backend='sqlite',
+                expire_after=request_cache_expiry,
+                allowable_methods=('GET',),
+                urls_expire_after={
+                    '*/api/bulk/2.0/syncs/*': requests_cache.DO_NOT_CACHE,
+                    'login.eloqua.com*': requests_cache.DO_NOT_CACHE
+                })
+        else:
+            self.__session = requests.Session()
+        # Streams sync concurrently and each prefetches a page ahead, so
+        # size the keep-alive pool to cover every worker - reusing a warm
+        # connection saves a TCP+TLS handshake on each poll and page fetch
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.__session.mount('https://', adapter)
+        self.__session.mount('http://', adapter)
+        # Be explicit that compressed responses are welcome - export data
+        # pages are large, text-heavy JSON that gzips 5-10x. Buffered
+        # requests decompress transparently, and stream() sets
+        # decode_content so streamed pages decompress incrementally too
+        self.__session.headers['Accept-Encoding'] = 'gzip, deflate'
         self.__base_url = None
 
     def __enter__(self):
@@ -40,49 +80,53 @@ class EloquaClient(object):
                           max_tries=5,
                           factor=2)
     def get_access_token(self):
-        if self.__access_token is not None and self.__expires > datetime.utcnow():
-            return
-
-        headers = {}
-        if self.__user_agent:
-            headers['User-Agent'] = self.__user_agent
-
-        response = self.__session.post(
-            'https://login.eloqua.com/auth/oauth2/token',
-            auth=(self.__client_id, self.__client_secret),
-            headers=headers,
-            data={
-                'grant_type': 'refresh_token',
-                'refresh_token': self.__refresh_token,
-                'redirect_uri': self.__redirect_uri,
-                'scope': 'full'
-            })
-
-        if response.status_code >= 500:
-            raise Server5xxError()
-
-        if response.status_code != 200:
-            eloqua_response = response.json()
-            eloqua_response.update(
-                {'status': response.status_code})
-            raise Exception(
-                'Unable to authenticate (Eloqua response: `{}`)'.format(
-                    eloqua_response))
-
-        data = response.json()
-
-        self.__access_token = data['access_token']
-        self.__refresh_token = data['refresh_token']
-
-        ## refresh_token rotates on every reauth
-        with open(self.__config_path) as file:
-            config = json.load(file)
-        config['refresh_token'] = data['refresh_token']
-        with open(self.__config_path, 'w') as file:
-            json.dump(config, file, indent=2)
-
-        expires_seconds = data['expires_in'] - 10 # pad by 10 seconds
-        self.__expires = datetime.utcnow() + timedelta(seconds=expires_seconds)
+        # Re-check expiry under the lock: threads that queued behind an
+        # in-flight refresh find a fresh token here and return without
+        # attempting a refresh of their own
+        with self.__token_lock:
+            if self.__access_token is not None and self.__expires > datetime.utcnow():
+                return
+
+            headers = {}
+            if self.__user_agent:
+                headers['User-Agent'] = self.__user_agent
+
+            response = self.__session.post(
+                'https://login.eloqua.com/auth/oauth2/token',
+                auth=(self.__client_id, self.__client_secret),
+                headers=headers,
+                data={
+                    'grant_type': 'refresh_token',
+                    'refresh_token': self.__refresh_token,
+                    'redirect_uri': self.__redirect_uri,
+                    'scope': 'full'
+                })
+
+            if response.status_code >= 500:
+                raise Server5xxError()
+
+            if response.status_code != 200:
+                eloqua_response = response.json()
+                eloqua_response.update(
+                    {'status': response.status_code})
+                raise Exception(
+                    'Unable to authenticate (Eloqua response: `{}`)'.format(
+                        eloqua_response))
+
+            data = response.json()
+
+            self.__access_token = data['access_token']
+            self.__refresh_token = data['refresh_token']
+
+            ## refresh_token rotates on every reauth
+            with open(self.__config_path) as file:
+                config = json.load(file)
+            config['refresh_token'] = data['refresh_token']
+            with open(self.__config_path, 'w') as file:
+                json.dump(config, file, indent=2)
+
+            expires_seconds = data['expires_in'] - 10 # pad by 10 seconds
+            self.__expires = datetime.utcnow() + timedelta(seconds=expires_seconds)
 
     def get_base_urls(self):
         data = self.request('GET',
@@ -130,6 +174,47 @@ class EloquaClient(object):
 
         return response.json()
 
+    @backoff.on_exception(backoff.expo,
+                          (Server5xxError, ConnectionError),
+                          max_tries=5,
+                          factor=2)
+    def stream(self, path=None, url=None, **kwargs):
+        self.get_access_token()
+
+        if not url and self.__base_url is None:
+            self.get_base_urls()
+
+        if not url and path:
+            url = self.__base_url + path
+
+        if 'endpoint' in kwargs:
+            endpoint = kwargs['endpoint']
+            del kwargs['endpoint']
+        else:
+            endpoint = None
+
+        if 'headers' not in kwargs:
+            kwargs['headers'] = {}
+        kwargs['headers']['Authorization'] = 'Bearer {}'.format(self.__access_token)
+
+        if self.__user_agent:
+            kwargs['headers']['User-Agent'] = self.__user_agent
+
+        with metrics.http_request_timer(endpoint) as timer:
+            response = self.__session.request('GET', url, stream=True, **kwargs)
+            timer.tags[metrics.Tag.http_status_code] = response.status_code
+
+        if response.status_code >= 500:
+            raise Server5xxError()
+
+        response.raise_for_status()
+
+        ## urllib3 only decompresses transparently when reading through
+        ## response.content; reading response.raw directly needs this flag
+        response.raw.decode_content = True
+
+        return response
+
     def get(self, path, **kwargs):
         return self.request('GET', path=path, **kwargs)
 
@@ -1,8 +1,12 @@
 import re
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import partial
 
+import ijson
 import pendulum
 import singer
 from singer import metrics, metadata, Transformer, UNIX_SECONDS_INTEGER_DATETIME_PARSING
@@ -17,14 +21,76 @@ from tap_eloqua.schema import (
 
 LOGGER = singer.get_logger()
 
-MIN_RETRY_INTERVAL = 2 # 2 seconds
-MAX_RETRY_INTERVAL = 300 # 5 minutes
+MIN_POLL_INTERVAL = 2 # 2 seconds
+MAX_POLL_INTERVAL = 60 # 1 minute
+POLL_INTERVAL_BASE = 1.3
 MAX_RETRY_ELAPSED_TIME = 21600 # 6 hours
 
-def next_sleep_interval(previous_sleep_interval):
-    min_interval = previous_sleep_interval or MIN_RETRY_INTERVAL
-    max_interval = previous_sleep_interval * 2 or MIN_RETRY_INTERVAL
-    return min(MAX_RETRY_INTERVAL, random.randint(min_interval, max_interval))
+# Compiled once - sync URIs always look like '/syncs/12345'
+SYNC_URI_RE = re.compile(r'/syncs/([0-9]+)')
+
+# The REST endpoint streams all share sync_static_endpoint; this table is
+# the only thing that differs between them
+STATIC_ENDPOINTS = [
+    {
+        'stream_id': 'visitors',
+        'path': 'data/visitors',
+        'updated_at_col': 'V_LastVisitDateAndTime'
+    },
+    {
+        'stream_id': 'campaigns',
+        'path': 'assets/campaigns',
+        'updated_at_col': 'updatedAt'
+    },
+    {
+        'stream_id': 'emails',
+        'path': 'assets/emails',
+        'updated_at_col': 'updatedAt'
+    },
+    {
+        'stream_id': 'forms',
+        'path': 'assets/forms',
+        'updated_at_col': 'updatedAt'
+    },
+    {
+        'stream_id': 'assets',
+        'path': 'assets/externals',
+        'updated_at_col': 'updatedAt'
+    },
+    {
+        'stream_id': 'emailGroups',
+        'path': 'assets/email/groups',
+        'updated_at_col': 'updatedAt'
+    }
+]
+
+# Streams sync concurrently; state is shared and singer.write_state writes to
+# stdout, so all state mutations are serialized through this lock
+STATE_LOCK = threading.Lock()
+
+def next_sleep_interval(previous_sleep_interval,
+                        base=POLL_INTERVAL_BASE,
+                        min_interval=MIN_POLL_INTERVAL,
+                        max_interval=MAX_POLL_INTERVAL):
+    # Shallow geometric schedule with a little jitter, bounded to
+    # [min_interval, max_interval]. Successive sleeps are roughly
+    # 2, 2.9, 4.1, 5.6, 7.5, 10, 13, 17, 22, 29, 38, 49, 60, 60, ...
+    # so most exports (which finish in a minute or two) are picked up
+    # within seconds of completing, at the cost of a few extra polls on
+    # very long exports versus the old doubling schedule capped at 300s.
+    return min(max_interval,
+               max(min_interval,
+                   previous_sleep_interval * base + random.uniform(0, 0.5)))
+
+def to_datetime_string(value):
+    # Bookmark values are ISO-8601, which the C-implemented
+    # datetime.fromisoformat parses in a fraction of the time pendulum.parse
+    # takes; keep pendulum as the fallback for anything more exotic
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return pendulum.parse(value).to_datetime_string()
+    return parsed.strftime('%Y-%m-%d %H:%M:%S')
 
 def get_bookmark(state, stream, default):
     return (
@@ -42,50 +108,165 @@ def get_bulk_bookmark(state, stream):
     return bookmark
 
 def write_bookmark(state, stream, value):
-    if 'bookmarks' not in state:
-        state['bookmarks'] = {}
-    state['bookmarks'][stream] = value
-    singer.write_state(state)
+    with STATE_LOCK:
+        if 'bookmarks' not in state:
+            state['bookmarks'] = {}
+        # Serializing state costs a full JSON dump of an ever-growing dict;
+        # skip it when the bookmark has not moved
+        if state['bookmarks'].get(stream) == value:
+            return
+        state['bookmarks'][stream] = value
+        singer.write_state(state)
 
 def write_bulk_bookmark(state, stream_name, sync_id, offset, max_updated_at):
-    if 'bookmarks' not in state:
-        state['bookmarks'] = {}
-    state['bookmarks'][stream_name] = {
-        'sync_id': sync_id,
-        'offset': offset,
-        'datetime': max_updated_at
-    }
-    singer.write_state(state)
+    with STATE_LOCK:
+        if 'bookmarks' not in state:
+            state['bookmarks'] = {}
+        bookmark = {
+            'sync_id': sync_id,
+            'offset': offset,
+            'datetime': max_updated_at
+        }
+        if state['bookmarks'].get(stream_name) == bookmark:
+            return
+        state['bookmarks'][stream_name] = bookmark
+        singer.write_state(state)
+
+def coerce_datetime(value):
+    # Matches the Transformer's _transform_datetime under
+    # UNIX_SECONDS_INTEGER_DATETIME_PARSING: epoch seconds convert first
+    # regardless of type - the REST API returns them as strings (see the
+    # int() on the replication column in sync_static_endpoint) - and only
+    # values int() rejects parse as datetime strings, pegged to UTC since
+    # singer.utils.strftime requires a UTC datetime
+    try:
+        return singer.utils.strftime(pendulum.from_timestamp(int(value)))
+    except (TypeError, ValueError):
+        pass
+    return singer.utils.strftime(pendulum.parse(value).in_timezone('UTC'))
+
+def coerce_string(value):
+    return value if isinstance(value, str) else str(value)
+
+def compile_coercers(schema, stream_metadata):
+    # Precompile the per-field work Transformer.transform does for a flat
+    # schema - field selection plus scalar coercion - so persist_records can
+    # skip the generic schema walker on every record. Returns a field ->
+    # coercer map (fields absent from the map are dropped, a None coercer
+    # passes the value through), or None when any field needs the generic
+    # Transformer (arrays, objects, multiple non-null types).
+    coercers = {}
+    for field_name, field_schema in schema.get('properties', {}).items():
+        field_metadata = stream_metadata.get(('properties', field_name), {})
+        if not (field_metadata.get('selected', True) or
+                field_metadata.get('inclusion', 'available') == 'automatic'):
+            continue
+
+        types = field_schema.get('type')
+        if isinstance(types, str):
+            types = [types]
+        non_null_types = [t for t in (types or []) if t != 'null']
+        if len(non_null_types) != 1:
+            return None
+
+        field_type = non_null_types[0]
+        if field_type == 'string':
+            if field_schema.get('format') == 'date-time':
+                coercers[field_name] = coerce_datetime
+            else:
+                coercers[field_name] = coerce_string
+        elif field_type == 'integer':
+            coercers[field_name] = int
+        elif field_type == 'number':
+            coercers[field_name] = float
+        elif field_type == 'boolean':
+            coercers[field_name] = None
+        else:
+            return None
+    return coercers
+
+# Per-run cache of (schema dict, metadata map, compiled coercers) keyed by
+# stream_id. All three are invariant while a stream syncs, but the first two
+# were re-materialized from the catalog on every write_schema and
+# persist_records call - once per page
+_SCHEMA_CACHE = {}
+
+def get_stream_schema(catalog, stream_id):
+    if stream_id not in _SCHEMA_CACHE:
+        stream = catalog.get_stream(stream_id)
+        schema = stream.schema.to_dict()
+        stream_metadata = metadata.to_map(stream.metadata)
+        _SCHEMA_CACHE[stream_id] = (schema,
+                                    stream_metadata,
+                                    compile_coercers(schema, stream_metadata))
+    return _SCHEMA_CACHE[stream_id]
 
 def write_schema(catalog, stream_id):
     stream = catalog.get_stream(stream_id)
-    schema = stream.schema.to_dict()
+    schema, _, _ = get_stream_schema(catalog, stream_id)
     singer.write_schema(stream_id, schema, stream.key_properties)
 
 def persist_records(catalog, stream_id, records, activity_type=None):
-    stream = catalog.get_stream(stream_id)
-    schema = stream.schema.to_dict()
-    stream_metadata = metadata.to_map(stream.metadata)
+    schema, stream_metadata, coercers = get_stream_schema(catalog, stream_id)
     with metrics.record_counter(stream_id) as counter:
-        for record in records:
-            if activity_type is not None:
-                # NB: Synthesize CreatedAt here as a workaround to fix activity exports (PR #19)
-                record['CreatedAt'] = record['ActivityDate']
+        # Bind hot attributes as locals - these loops run once per record
+        write_record = singer.write_record
+        increment = counter.increment
+        if coercers is not None:
+            for record in records:
+                if activity_type is not None:
+                    # NB: Synthesize CreatedAt here as a workaround to fix activity exports (PR #19)
+                    record['CreatedAt'] = record['ActivityDate']
+                out = {}
+                for field, value in record.items():
+                    if field not in coercers:
+                        continue
+                    coerce = coercers[field]
+                    if value is None or coerce is None:
+                        out[field] = value
+                    else:
+                        out[field] = coerce(value)
+                write_record(stream_id, out)
+                increment()
+        else:
             with Transformer(
                 integer_datetime_fmt=UNIX_SECONDS_INTEGER_DATETIME_PARSING) as transformer:
-                record = transformer.transform(record,
-                                               schema,
-                                               stream_metadata)
-            singer.write_record(stream_id, record)
-            counter.increment()
+                transform = transformer.transform
+                for record in records:
+                    if activity_type is not None:
+                        # NB: Synthesize CreatedAt here as a workaround to fix activity exports (PR #19)
+                        record['CreatedAt'] = record['ActivityDate']
+                    record = transform(record,
+                                       schema,
+                                       stream_metadata)
+                    write_record(stream_id, record)
+                    increment()
 
 def transform_export_row(row):
-    out = {}
-    for field, value in row.items():
-        if value == '':
-            value = None
-        out[field] = value
-    return out
+    # A comprehension presizes the output dict and avoids the per-field
+    # store opcodes of the explicit loop this replaces
+    return {field: (None if value == '' else value)
+            for field, value in row.items()}
+
+EXPORT_ITEM_PREFIX = 'items.item'
+
+def parse_export_page(raw, page):
+    # Incrementally parse an export data page so a full page of rows is never
+    # resident at once. Bulk export rows are flat maps of scalars, so rows can
+    # be rebuilt directly from the ijson event stream. `hasMore` is recorded
+    # on `page` as soon as it is seen - Eloqua emits it after `items`, so it
+    # is available once the generator is exhausted.
+    field_offset = len(EXPORT_ITEM_PREFIX) + 1
+    row = {}
+    for prefix, event, value in ijson.parse(raw):
+        if event == 'end_map' and prefix == EXPORT_ITEM_PREFIX:
+            yield row
+            row = {}
+        elif event in ('string', 'number', 'boolean', 'null') and \
+             prefix.startswith(EXPORT_ITEM_PREFIX):
+            row[prefix[field_offset:]] = value
+        elif prefix == 'hasMore':
+            page['hasMore'] = value
 
 def stream_export(client,
                   state,
@@ -101,39 +282,85 @@ def stream_export(client,
 
     write_schema(catalog, stream_name)
 
-    has_more = True
-    max_updated_at = None
-    while has_more:
-        LOGGER.info('{} - Paginating export results - offset: {}, limit: {}'.format(
-            stream_name,
-            offset,
-            bulk_page_size))
-
-        write_bulk_bookmark(state, stream_name, sync_id, offset, bookmark_datetime)
-
-        data = client.get(
+    def fetch_page(page_offset):
+        return client.stream(
             '/api/bulk/2.0/syncs/{}/data'.format(sync_id),
             params={
                 'limit': bulk_page_size,
-                'offset': offset
+                'offset': page_offset
             },
             endpoint='export_data')
-        has_more = data['hasMore']
-        offset += bulk_page_size
 
-        if 'items' in data and data['items']:
-            records = map(transform_export_row, data['items'])
-            persist_records(catalog, stream_name, records, activity_type=activity_type)
+    has_more = True
+    max_updated_at = None
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        next_page = prefetcher.submit(fetch_page, offset)
+        while has_more:
+            LOGGER.info('{} - Paginating export results - offset: {}, limit: {}'.format(
+                stream_name,
+                offset,
+                bulk_page_size))
+
+            write_bulk_bookmark(state, stream_name, sync_id, offset, bookmark_datetime)
+
+            response = next_page.result()
+            # Speculatively open the request for the next page so the server
+            # starts producing it while this page streams through
+            # persist_records; at most one request is in flight ahead
+            next_page = prefetcher.submit(fetch_page, offset + bulk_page_size)
+
+            page = {'hasMore': False}
+
+            def records():
+                # Single pass: transform each row and track the bookmark value
+                # inline while persist_records consumes the generator
+                nonlocal max_updated_at
+                for item in parse_export_page(response.raw, page):
+                    value = item[updated_at_field]
+                    if max_updated_at is None or value > max_updated_at:
+                        max_updated_at = value
+                    yield transform_export_row(item)
+
+            with response:
+                persist_records(catalog, stream_name, records(), activity_type=activity_type)
+
+            has_more = page['hasMore']
+            offset += bulk_page_size
 
-            max_page_updated_at = max(map(lambda x: x[updated_at_field], data['items']))
-            if max_updated_at is None or max_page_updated_at > max_updated_at:
-                max_updated_at = max_page_updated_at
+        try:
+            # The last speculative request is one page past the end; Eloqua
+            # returns an empty page - close it unread
+            next_page.result().close()
+        except Exception:
+            pass
 
     final_datetime = max_updated_at or bookmark_datetime
     write_bulk_bookmark(state, stream_name, None, None, final_datetime)
 
     return final_datetime
 
+# Per-run cache of (field statement map, root metadata) keyed by stream name.
+# sync_bulk_obj re-runs once per date window for activity streams, and the
+# selected fields never change within a run
+_FIELDS_CACHE = {}
+
+def get_export_fields(stream):
+    stream_name = stream.tap_stream_id
+    if stream_name not in _FIELDS_CACHE:
+        obj_meta = next((meta['metadata'] for meta in stream.metadata
+                         if not meta['breadcrumb']), None)
+        fields = {
+            meta['breadcrumb'][1]: meta['metadata']['tap-eloqua.statement']
+            for meta in stream.metadata
+            if meta['breadcrumb'] and
+               (meta['metadata'].get('selected', True) or
+                meta['metadata'].get('inclusion', 'available') == 'automatic')
+        }
+        _FIELDS_CACHE[stream_name] = (fields, obj_meta)
+    fields, obj_meta = _FIELDS_CACHE[stream_name]
+    # Copied because activity exports pop the synthetic CreatedAt field
+    return dict(fields), obj_meta
+
 class ActivityExportTooLarge(Exception):
     """
     An Eloqua Bulk Activity export can have a maximum of 5 million rows in it.
@@ -157,7 +384,7 @@ def sync_bulk_obj(client, catalog, state, start_date, stream_name, bulk_page_siz
 
     last_bookmark = get_bulk_bookmark(state, stream_name)
     last_date_raw = last_bookmark.get('datetime', start_date)
-    last_date = pendulum.parse(last_date_raw).to_datetime_string()
+    last_date = to_datetime_string(last_date_raw)
     last_sync_id = last_bookmark.get('sync_id')
     last_offset = last_bookmark.get('offset')
 
@@ -179,17 +406,9 @@ def sync_bulk_obj(client, catalog, state, start_date, stream_name, bulk_page_siz
             else:
                 raise
 
-    fields = {}
-    obj_meta = None
-    for meta in stream.metadata:
-        if not meta['breadcrumb']:
-            obj_meta = meta['metadata']
-        elif meta['metadata'].get('selected', True) or \
-             meta['metadata'].get('inclusion', 'available') == 'automatic':
-            field_name = meta['breadcrumb'][1]
-            fields[field_name] = meta['metadata']['tap-eloqua.statement']
-
-    num_fields = len(fields.values())
+    fields, obj_meta = get_export_fields(stream)
+
+    num_fields = len(fields)
     if num_fields > 250:
         raise Exception('{} - Exports can only have 250 fields selected. {} are selected.'.format(
             stream_name, num_fields))
@@ -198,13 +417,13 @@ def sync_bulk_obj(client, catalog, state, start_date, stream_name, bulk_page_siz
 
     language_obj = obj_meta['tap-eloqua.query-language-name']
 
-    _filter = "'{{" + language_obj + "." + updated_at_field + "}}' >= '" + last_date + "'"
+    _filter = f"'{{{{{language_obj}.{updated_at_field}}}}}' >= '{last_date}'"
 
     if end_date:
-        _filter += " AND '{{" + language_obj + "." + updated_at_field + "}}' < '" + end_date.to_datetime_string() + "'"
+        _filter += f" AND '{{{{{language_obj}.{updated_at_field}}}}}' < '{end_date.to_datetime_string()}'"
 
     if activity_type is not None:
-        _filter += " AND '{{Activity.Type}}' = '" + activity_type + "'"
+        _filter += f" AND '{{{{Activity.Type}}}}' = '{activity_type}'"
         # NB: We observed shuffled data when Activity.CreatedAt was specified twice in the query.
         #     The key 'CreatedAt' is synthetic, so add it in after the export. (PR #19)
         fields.pop('CreatedAt', None)
@@ -244,13 +463,14 @@ def sync_bulk_obj(client, catalog, state, start_date, stream_name, bulk_page_siz
             },
             endpoint='export_create_sync')
 
-        sync_id = re.match(r'/syncs/([0-9]+)', data['uri']).groups()[0]
+        sync_id = SYNC_URI_RE.match(data['uri']).groups()[0]
 
         LOGGER.info('{} - Created export - {}'.format(stream_name, sync_id))
 
         write_bulk_bookmark(state, stream_name, sync_id, 0, last_date_raw)
 
         sleep = 0
+        last_status = None
         start_time = time.time()
         while True:
             data = client.get(
@@ -260,24 +480,34 @@ def sync_bulk_obj(client, catalog, state, start_date, stream_name, bulk_page_siz
             status = data['status']
             if status == 'success':
                 break
-            elif status not in ['pending', 'active']:
+
+            # Terminal states raise immediately - no final sleep on the
+            # failure or timeout paths
+            if status not in ('pending', 'active'):
                 message = '{} - status: {}, exporting failed'.format(
                         stream_name,
                         status)
                 LOGGER.error(message)
                 raise Exception(message)
-            elif (time.time() - start_time) > MAX_RETRY_ELAPSED_TIME:
+
+            if (time.time() - start_time) > MAX_RETRY_ELAPSED_TIME:
                 message = '{} - export deadline exceeded ({} secs)'.format(
                         stream_name,
                         MAX_RETRY_ELAPSED_TIME)
                 LOGGER.error(message)
                 raise Exception(message)
 
+            if status != last_status:
+                # The export made progress (e.g. pending -> active), so it
+                # may finish soon - restart the schedule from the bottom
+                sleep = 0
+            last_status = status
+
             sleep = next_sleep_interval(sleep)
             LOGGER.info('{} - status: {}, sleeping for {} seconds'.format(
                         stream_name,
                         status,
-                        sleep))
+                        round(sleep, 1)))
             time.sleep(sleep)
 
     # Check record count
@@ -308,7 +538,7 @@ def sync_static_endpoint(client, catalog, state, start_date, stream_id, path, up
     write_schema(catalog, stream_id)
 
     last_date_raw = get_bookmark(state, stream_id, start_date)
-    last_date = pendulum.parse(last_date_raw).to_datetime_string()
+    last_date = to_datetime_string(last_date_raw)
     search = "{}>='{}'".format(updated_at_col, last_date)
 
     page = 1
@@ -338,18 +568,29 @@ def sync_static_endpoint(client, catalog, state, start_date, stream_id, path, up
         if len(records) < count:
             break
 
-def get_selected_streams(catalog):
+def classify_streams(catalog):
+    # One walk over the catalog finds both the selected streams and the
+    # custom object streams - metadata.to_map is not cheap on streams with
+    # hundreds of fields, so avoid mapping each stream twice
     selected_streams = set()
+    custom_obj_streams = set()
     for stream in catalog.streams:
         mdata = metadata.to_map(stream.metadata)
         root_metadata = mdata.get(())
-        if root_metadata and root_metadata.get('selected') is True:
+        if not root_metadata:
+            continue
+        if root_metadata.get('selected') is True:
             selected_streams.add(stream.tap_stream_id)
-    return list(selected_streams)
+        if root_metadata.get('tap-eloqua.id'):
+            custom_obj_streams.add(stream.tap_stream_id)
+    return list(selected_streams), list(custom_obj_streams)
 
 def update_current_stream(state, stream_name):
-    state['current_stream'] = stream_name
-    singer.write_state(state)
+    with STATE_LOCK:
+        if state.get('current_stream') == stream_name:
+            return
+        state['current_stream'] = stream_name
+        singer.write_state(state)
 
 def should_sync_stream(selected_streams, last_stream, stream_name):
     if last_stream == stream_name or last_stream is None:
@@ -359,15 +600,6 @@ def should_sync_stream(selected_streams, last_stream, stream_name):
             return True, last_stream
     return False, last_stream
 
-def get_custom_obj_streams(catalog):
-    custom_streams = set()
-    for stream in catalog.streams:
-        mdata = metadata.to_map(stream.metadata)
-        root_metadata = mdata.get(())
-        if root_metadata and root_metadata.get('tap-eloqua.id'):
-            custom_streams.add(stream.tap_stream_id)
-    return list(custom_streams)
-
 def sync_activity_stream(client,
                          stream_name,
                          state,
@@ -384,7 +616,6 @@ def sync_activity_stream(client,
             last_date_raw = get_bulk_bookmark(state, stream_name).get('datetime', start_date)
             last_date = pendulum.parse(last_date_raw)
 
-            update_current_stream(state, stream_name)
             sync_bulk_obj(client,
                           catalog,
                           state,
@@ -404,26 +635,35 @@ def sync_activity_stream(client,
             if end_date > sync_start:
                 end_date = sync_start
 
-def sync(client, catalog, state, start_date, bulk_page_size):
-    selected_streams = get_selected_streams(catalog)
+def sync(client, catalog, state, start_date, bulk_page_size, parallelism=4):
+    selected_streams, custom_obj_streams = classify_streams(catalog)
 
     if not selected_streams:
         return
 
     last_stream = state.get('current_stream')
 
+    # Each stream's sync is dominated by HTTP latency and the bulk export
+    # poll loop, so independent streams are submitted to a thread pool and
+    # run concurrently. A `current_stream` left by an earlier sequential
+    # run is honored here when selecting tasks, then cleared below: with
+    # concurrent streams a single in-progress marker cannot describe what
+    # completed, and per-stream bookmarks carry the real resume
+    # granularity.
+    tasks = []
+
     for bulk_object in BUILT_IN_BULK_OBJECTS:
         should_stream, last_stream = should_sync_stream(selected_streams,
                                                         last_stream,
                                                         bulk_object)
         if should_stream:
-            update_current_stream(state, bulk_object)
-            sync_bulk_obj(client,
-                          catalog,
-                          state,
-                          start_date,
-                          bulk_object,
-                          bulk_page_size)
+            tasks.append(partial(sync_bulk_obj,
+                                 client,
+                                 catalog,
+                                 state,
+                                 start_date,
+                                 bulk_object,
+                                 bulk_page_size))
 
     for activity_type in ACTIVITY_TYPES:
         stream_name = activity_type_to_stream(activity_type)
@@ -431,75 +671,54 @@ def sync(client, catalog, state, start_date, bulk_page_size):
                                                         last_stream,
                                                         stream_name)
         if should_stream:
-            sync_activity_stream(client,
+            tasks.append(partial(sync_activity_stream,
+                                 client,
                                  stream_name,
                                  state,
                                  catalog,
                                  start_date,
                                  bulk_page_size,
-                                 activity_type)
+                                 activity_type))
 
-    for stream_name in get_custom_obj_streams(catalog):
+    for stream_name in custom_obj_streams:
         should_stream, last_stream = should_sync_stream(selected_streams,
                                                         last_stream,
                                                         stream_name)
         if should_stream:
-            update_current_stream(state, stream_name)
-            sync_bulk_obj(client,
-                          catalog,
-                          state,
-                          start_date,
-                          stream_name,
-                          bulk_page_size)
-
-    static_endpoints = [
-        {
-            'stream_id': 'visitors',
-            'path': 'data/visitors',
-            'updated_at_col': 'V_LastVisitDateAndTime'
-        },
-        {
-            'stream_id': 'campaigns',
-            'path': 'assets/campaigns',
-            'updated_at_col': 'updatedAt'
-        },
-        {
-            'stream_id': 'emails',
-            'path': 'assets/emails',
-            'updated_at_col': 'updatedAt'
-        },
-        {
-            'stream_id': 'forms',
-            'path': 'assets/forms',
-            'updated_at_col': 'updatedAt'
-        },
-        {
-            'stream_id': 'assets',
-            'path': 'assets/externals',
-            'updated_at_col': 'updatedAt'
-        },
-        {
-            'stream_id': 'emailGroups',
-            'path': 'assets/email/groups',
-            'updated_at_col': 'updatedAt'
-        }        
-    ]
-
-    for static_endpoint in static_endpoints:
+            tasks.append(partial(sync_bulk_obj,
+                                 client,
+                                 catalog,
+                                 state,
+                                 start_date,
+                                 stream_name,
+                                 bulk_page_size))
+
+    for static_endpoint in STATIC_ENDPOINTS:
         stream_id = static_endpoint['stream_id']
         should_stream, last_stream = should_sync_stream(selected_streams,
                                                         last_stream,
                                                         stream_id)
         if should_stream:
-            update_current_stream(state, stream_id)
-            path = static_endpoint['path']
-            updated_at_col = static_endpoint['updated_at_col']
-            sync_static_endpoint(client,
+            tasks.append(partial(sync_static_endpoint,
+                                 client,
                                  catalog,
                                  state,
                                  start_date,
                                  stream_id,
-                                 path,
-                                 updated_at_col)
+                                 static_endpoint['path'],
+                                 static_endpoint['updated_at_col']))
 
+    # The sequential-era pointer has been consumed selecting tasks; clear
+    # it before any stream runs so a crash mid-run cannot leave it aimed at
+    # an arbitrary in-flight stream, which would make the next run skip
+    # streams that never finished
     update_current_stream(state, None)
+
+    try:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        _SCHEMA_CACHE.clear()
+        _FIELDS_CACHE.clear()